@@ -5,10 +5,20 @@ A cross-platform GUI tool for reading Modbus TCP register values
 """
 
 import sys
+import contextlib
+import csv
+import functools
+import io
 import threading
+import inspect
 import ipaddress
-import struct
+import locale
+import os
+import re
+import socket
 import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 
 from updater import UpdateChecker
@@ -41,12 +51,165 @@ from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QSettings
-from PyQt6.QtGui import QTextCursor, QColor, QTextCharFormat
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QObject,
+    QSettings,
+    QTimer,
+    QSaveFile,
+    QIODevice,
+)
+from PyQt6.QtGui import QTextCursor, QColor, QTextCharFormat, QFontMetrics
 from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import pymodbus
 from opf_parser import parse_opf_file
+from register_decoder import decode_registers
+
+# Columns of the results table (and of exported CSV files)
+COLUMN_HEADERS = (
+    "Address",
+    "Tag Name",
+    "Hex",
+    "Binary",
+    "Uint16",
+    "Int16",
+    "Uint32",
+    "Int32",
+    "Float32",
+    "String",
+)
+
+# Widest typical text of each column, used to size the columns up front
+COLUMN_WIDTH_SAMPLES = (
+    "65536.16",
+    "Channel1.Device1.Tag1",
+    "0xFFFF",
+    "1111111111111111",
+    "65535",
+    "-32768",
+    "4294967295",
+    "-2147483648",
+    "-123456.000000",
+    "String",
+)
+
+# Placeholder cell text shared by every error row / single-bit row
+ERROR_ROW = ("ERROR",) * 10
+_ERR_COLS = ERROR_ROW[1:]  # Everything after the Address column
+BIT_ROW_TAIL = ("-",) * 7  # Columns 3-9 of a coil/discrete input row
+BIT_CHILD_TAIL = BIT_ROW_TAIL[2:]  # Columns 5-9 of a register's bit row
+BIT_TEXT = ("0", "1")  # Display text of a bit, indexed by its value
+
+# Info label stylesheet for each log tag (anything else is shown in black)
+LOG_STYLES = {
+    tag: f"color: {color};  padding: 5px;"
+    for tag, color in (("success", "green"), ("error", "red"), ("info", "blue"))
+}
+DEFAULT_LOG_STYLE = "color: black;  padding: 5px;"
+
+# Individual-mode entry for every register when the device can't be reached.
+# Result entries are only ever read, so all of them share this one dict.
+CONNECT_FAILED = {"error": "Failed to connect to device"}
+
+# Protocol limits for a single read request
+MAX_REGISTERS_PER_READ = 125
+MAX_BITS_PER_READ = 2000
+
+# Modbus exception code for a function code the device doesn't support. It
+# applies to every address, so splitting the request can't get past it.
+ILLEGAL_FUNCTION = 1
+# Exception code for an address the device doesn't have. Unlike busy/failure
+# codes it won't clear by itself, so the address is not re-read every poll.
+ILLEGAL_DATA_ADDRESS = 2
+
+# Upper bound (seconds) for the continuous-mode reconnect backoff
+MAX_RECONNECT_DELAY = 30.0
+
+
+def _unit_id_keyword():
+    """Keyword the installed pymodbus read methods take the unit ID as (or None)"""
+    try:
+        params = inspect.signature(ModbusTcpClient.read_holding_registers).parameters
+    except (TypeError, ValueError):
+        return "slave"
+
+    # pymodbus 3.x uses slave= (device_id= from 3.10); 2.x takes unit= via **kwargs
+    for name in ("slave", "device_id", "unit"):
+        if name in params:
+            return name
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return "unit"
+    return None
+
+
+# Probed once at import instead of retrying each request on TypeError
+UNIT_ID_KEYWORD = _unit_id_keyword()
+
+# pymodbus client method for each register type
+READ_METHODS = {
+    "holding": "read_holding_registers",
+    "input": "read_input_registers",
+    "coils": "read_coils",
+    "discrete": "read_discrete_inputs",
+}
+
+
+def _tune_socket(client):
+    """Set low-latency and keepalive options on a connected client's socket
+
+    Modbus requests are tiny; with Nagle's algorithm on, one can sit in the
+    send buffer waiting for the ACK of the previous segment. Keepalive probes
+    let a connection kept open between polls notice a device that vanished.
+    """
+    sock = getattr(client, "socket", None)
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Start probing after 30 s idle rather than the OS default (often 2 h)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+    except OSError:
+        pass  # Not a TCP socket, or already closing
+
+
+def _plan_reads(addresses, max_span=MAX_REGISTERS_PER_READ):
+    """Group addresses into as few (start, count) block reads as possible
+
+    Consecutive addresses share a block, split so no block covers more than
+    max_span addresses. A gap always starts a new block, since it may be an
+    address the device rejects.
+    """
+    spans = []
+    for addr in sorted(set(addresses)):
+        if spans:
+            span_start, span_count = spans[-1]
+            if addr == span_start + span_count and span_count < max_span:
+                spans[-1] = (span_start, span_count + 1)
+                continue
+        spans.append((addr, 1))
+    return spans
+
+
+@dataclass
+class ScanConfig:
+    """Scan settings, read from the form on the GUI thread when a scan starts"""
+
+    ip: str
+    port: int
+    timeout: float
+    unit_id: int
+    start_reg: int  # As entered (0- or 1-based, see zero_based)
+    reg_count: int
+    register_type: str
+    zero_based: bool
+    continuous: bool
+    read_individually: bool
+    interval: float
 
 
 class WorkerSignals(QObject):
@@ -56,7 +219,6 @@ class WorkerSignals(QObject):
     status = pyqtSignal(str)
     progress = pyqtSignal(int)
     finished = pyqtSignal()
-    update_table = pyqtSignal(list, int)  # registers, start_address
 
 
 class ModbusScannerGUI(QMainWindow):
@@ -70,9 +232,35 @@ class ModbusScannerGUI(QMainWindow):
         self.scan_thread = None
         self.signals = WorkerSignals()
         self.tag_mappings = {}  # Store tag mappings from imported .opf files
+        # tag_mappings split by address for table rebuilds: address -> tag,
+        # and address -> {bit: tag}
+        self._register_tags = {}
+        self._bit_tags = {}
         self.tags_imported = False  # Track if tags have been imported
         self.auto_expand_bits = False  # Preference for auto-expanding bit rows
 
+        # Latest (registers, start_address) read by the worker. The worker
+        # only ever replaces it; the GUI picks it up on a timer, so fast polls
+        # coalesce into at most one table refresh per tick.
+        self._pending_snapshot = deque(maxlen=1)
+        self._table_refresh_timer = QTimer(self)
+        self._table_refresh_timer.setInterval(100)
+        self._table_refresh_timer.timeout.connect(self._flush_table_update)
+
+        # (item, column texts, joined text) for every table row, built on first
+        # filter or export and dropped whenever the table contents change
+        self._row_cache = None
+
+        # Open client connections keyed by (ip, port, timeout), kept between
+        # scans so repeat scans of a device skip the TCP handshake
+        self._clients = {}
+
+        # Arguments and display options of the last table refresh
+        self._last_snapshot = None
+
+        # Whether the current scan reads bits, resolved once when it starts
+        self._scan_is_bit_type = False
+
         # Settings for IP history
         self.settings = QSettings("ModScanTool", "ModbusScannerGUI")
 
@@ -90,7 +278,6 @@ class ModbusScannerGUI(QMainWindow):
         self.signals.status.connect(self.update_status)
         self.signals.progress.connect(self.update_progress)
         self.signals.finished.connect(self.scan_finished)
-        self.signals.update_table.connect(self.populate_table)
 
         self.init_ui()
         self.create_menu_bar()
@@ -101,8 +288,6 @@ class ModbusScannerGUI(QMainWindow):
             f"Update check on startup enabled: {self.updater.check_updates_on_startup}"
         )
         if self.updater.check_updates_on_startup:
-            from PyQt6.QtCore import QTimer
-
             print("Scheduling update check in 1 second...")
             QTimer.singleShot(3000, lambda: self.updater.check_for_updates(silent=True))
 
@@ -291,27 +476,18 @@ class ModbusScannerGUI(QMainWindow):
         filter_layout.addWidget(QLabel("Filter:"))
 
         self.filter_column_combo = QComboBox()
-        self.filter_column_combo.addItems(
-            [
-                "All Columns",
-                "Address",
-                "Tag Name",
-                "Hex",
-                "Binary",
-                "Uint16",
-                "Int16",
-                "Uint32",
-                "Int32",
-                "Float32",
-                "String",
-            ]
-        )
+        self.filter_column_combo.addItems(["All Columns", *COLUMN_HEADERS])
         self.filter_column_combo.setMaximumWidth(120)
         filter_layout.addWidget(self.filter_column_combo)
 
         self.filter_entry = QLineEdit()
         self.filter_entry.setPlaceholderText("Type to filter table...")
-        self.filter_entry.textChanged.connect(self.filter_table)
+        # Debounce typing: re-filter once the user pauses rather than per keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_table)
+        self.filter_entry.textChanged.connect(lambda _: self._filter_timer.start())
         self.filter_column_combo.currentIndexChanged.connect(self.filter_table)
         filter_layout.addWidget(self.filter_entry)
 
@@ -324,29 +500,23 @@ class ModbusScannerGUI(QMainWindow):
 
         # Create tree widget (replaces table for expandable bit rows)
         self.results_table = QTreeWidget()
-        self.results_table.setColumnCount(10)
-        self.results_table.setHeaderLabels(
-            [
-                "Address",
-                "Tag Name",
-                "Hex",
-                "Binary",
-                "Uint16",
-                "Int16",
-                "Uint32",
-                "Int32",
-                "Float32",
-                "String",
-            ]
-        )
+        self.results_table.setColumnCount(len(COLUMN_HEADERS))
+        self.results_table.setHeaderLabels(list(COLUMN_HEADERS))
 
-        # Configure tree widget
+        # Configure tree widget. Columns are sized from sample text instead
+        # of ResizeToContents, which re-measures every cell on each refresh.
         header = self.results_table.header()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setStretchLastSection(True)
+        metrics = QFontMetrics(self.results_table.font())
+        for col, (label, sample) in enumerate(zip(COLUMN_HEADERS, COLUMN_WIDTH_SAMPLES)):
+            width = max(metrics.horizontalAdvance(label), metrics.horizontalAdvance(sample))
+            header.resizeSection(col, width + 24)
 
         # Enable editing for Tag Name column
         self.results_table.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked)
+        # Tag edits change searchable text
+        self.results_table.itemChanged.connect(self._invalidate_row_cache)
 
         # Show Tag Name column by default (user can add tags manually)
         # No longer hide it - it's always available
@@ -572,17 +742,13 @@ Built with Python, PyQt6, and pymodbus
 
     def log_message(self, message, tag):
         """Display a log message in the info label"""
-        # Set color based on tag
-        color = "black"
-        if tag == "success":
-            color = "green"
-        elif tag == "error":
-            color = "red"
-        elif tag == "info":
-            color = "blue"
-
         self.info_label.setText(message)
-        self.info_label.setStyleSheet(f"color: {color};  padding: 5px;")
+
+        # Set color based on tag - restyling makes Qt re-parse the stylesheet,
+        # so only do it when the colour actually changes
+        style = LOG_STYLES.get(tag, DEFAULT_LOG_STYLE)
+        if self.info_label.styleSheet() != style:
+            self.info_label.setStyleSheet(style)
 
     def update_status(self, message):
         """Update the status label"""
@@ -594,56 +760,84 @@ Built with Python, PyQt6, and pymodbus
 
     def clear_results(self):
         """Clear the results table"""
+        self._invalidate_row_cache()
+        self._last_snapshot = None
         self.results_table.clear()
         self.progress_bar.setValue(0)
         self.info_label.setText("Table cleared.")
 
     def filter_table(self):
         """Filter tree items based on search criteria"""
-        filter_text = self.filter_entry.text().lower()
+        filter_text = self.filter_entry.text()
         column_index = (
             self.filter_column_combo.currentIndex() - 1
         )  # -1 because first item is "All Columns"
 
         if not filter_text:
             # Show all items if filter is empty
-            iterator = QTreeWidgetItemIterator(self.results_table)
-            while iterator.value():
-                iterator.value().setHidden(False)
-                iterator += 1
+            self._show_all_items()
             return
 
-        # Filter items
-        iterator = QTreeWidgetItemIterator(self.results_table)
-        while iterator.value():
-            item = iterator.value()
-            show_item = False
+        # Case-insensitive literal match, compiled once per filter change
+        search = re.compile(re.escape(filter_text), re.IGNORECASE).search
 
+        # Filter items (parents are visited before their bit rows)
+        for item, texts, row_text in self._cached_rows():
             if column_index == -1:
                 # Search all columns
-                for col in range(self.results_table.columnCount()):
-                    if filter_text in item.text(col).lower():
-                        show_item = True
-                        break
+                show_item = search(row_text) is not None
             else:
                 # Search specific column
-                if filter_text in item.text(column_index).lower():
-                    show_item = True
+                show_item = search(texts[column_index]) is not None
 
-            item.setHidden(not show_item)
+            # setHidden makes the view re-layout; skip it when nothing changes
+            if item.isHidden() == show_item:
+                item.setHidden(not show_item)
 
             # If this is a child item (bit row) that matches, also show its parent
-            if show_item and item.parent():
-                item.parent().setHidden(False)
+            if show_item:
+                parent = item.parent()
+                if parent is not None and parent.isHidden():
+                    parent.setHidden(False)
+
+    def _cached_rows(self):
+        """Return (item, column texts, joined row text) for every table item, caching the result"""
+        if self._row_cache is None:
+            columns = range(self.results_table.columnCount())
+            rows = []
+            # Parents are visited before their bit rows, matching the tree
+            iterator = QTreeWidgetItemIterator(self.results_table)
+            while iterator.value():
+                item = iterator.value()
+                text = item.text
+                texts = [text(col) for col in columns]
+                # Newline can't be typed into the filter box, so joining on it
+                # lets "All Columns" search the row in one call without
+                # matching across cell boundaries
+                rows.append((item, texts, "\n".join(texts)))
+                iterator += 1
+            self._row_cache = rows
+        return self._row_cache
 
-            iterator += 1
+    def _invalidate_row_cache(self, *args):
+        """Drop cached row text after the table contents change"""
+        self._row_cache = None
 
     def clear_filter(self):
         """Clear the filter and show all items"""
         self.filter_entry.clear()
+        # Clearing the text restarted the debounce timer; the items are shown
+        # right here, so skip the redundant pass it would trigger
+        self._filter_timer.stop()
+        self._show_all_items()
+
+    def _show_all_items(self):
+        """Unhide every hidden item in the tree"""
         iterator = QTreeWidgetItemIterator(self.results_table)
         while iterator.value():
-            iterator.value().setHidden(False)
+            item = iterator.value()
+            if item.isHidden():
+                item.setHidden(False)
             iterator += 1
 
     def validate_inputs(self):
@@ -711,6 +905,14 @@ Built with Python, PyQt6, and pymodbus
         if not self.validate_inputs():
             return
 
+        # Snapshot the form here on the GUI thread: the worker only sees this
+        # plain copy and never touches a widget
+        config = self._read_scan_config()
+        self._scan_is_bit_type = config.register_type in ["coils", "discrete"]
+
+        # Save settings (including IP history)
+        self.save_settings()
+
         self.scanning = True
         self.scan_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -724,37 +926,56 @@ Built with Python, PyQt6, and pymodbus
         self.signals.log.emit("=" * 80, "header")
         self.signals.log.emit("", "")
 
-        self.scan_thread = threading.Thread(target=self.scan_worker, daemon=True)
+        self._pending_snapshot.clear()
+        self._table_refresh_timer.start()
+
+        self.scan_thread = threading.Thread(
+            target=self.scan_worker, args=(config,), daemon=True
+        )
         self.scan_thread.start()
 
+    def _read_scan_config(self):
+        """Read the scan settings from the form (call after validate_inputs)"""
+        # Get polling interval
+        try:
+            interval = float(self.polling_interval_entry.text())
+            if interval < 0.1:
+                interval = 0.1  # Minimum 0.1 second interval
+        except ValueError:
+            interval = 1.0
+
+        return ScanConfig(
+            ip=self.ip_combo.currentText().strip(),
+            port=int(self.port_entry.text()),
+            timeout=float(self.timeout_entry.text()),
+            unit_id=int(self.unit_entry.text()),
+            start_reg=int(self.start_register_entry.text()),
+            reg_count=int(self.register_count_entry.text()),
+            register_type=self.get_register_type(),
+            zero_based=self.zero_based_check.isChecked(),
+            continuous=self.continuous_read_check.isChecked(),
+            read_individually=self.read_individually_check.isChecked(),
+            interval=interval,
+        )
+
     def stop_scan(self):
         """Stop the scanning process"""
         self.scanning = False
         self.signals.status.emit("Stopping scan...")
 
-    def scan_worker(self):
+    def scan_worker(self, config):
         """Worker thread for reading registers"""
         try:
-            ip = self.ip_combo.currentText().strip()
-            port = int(self.port_entry.text())
-            timeout = float(self.timeout_entry.text())
-            unit_id = int(self.unit_entry.text())
-            start_reg = int(self.start_register_entry.text())
-            reg_count = int(self.register_count_entry.text())
-            zero_based = self.zero_based_check.isChecked()
-            continuous = self.continuous_read_check.isChecked()
-            read_individually = self.read_individually_check.isChecked()
-
-            # Save settings (including IP history)
-            self.save_settings()
-
-            # Get polling interval
-            try:
-                interval = float(self.polling_interval_entry.text())
-                if interval < 0.1:
-                    interval = 0.1  # Minimum 0.1 second interval
-            except:
-                interval = 1.0
+            ip = config.ip
+            port = config.port
+            timeout = config.timeout
+            unit_id = config.unit_id
+            start_reg = config.start_reg
+            reg_count = config.reg_count
+            zero_based = config.zero_based
+            continuous = config.continuous
+            read_individually = config.read_individually
+            interval = config.interval
 
             # Store the user's input address for display
             display_start = start_reg
@@ -765,7 +986,7 @@ Built with Python, PyQt6, and pymodbus
                 start_reg -= 1
 
             # Determine register type to read
-            register_type = self.get_register_type()
+            register_type = config.register_type
             reg_name_map = {
                 "holding": "Holding Registers",
                 "input": "Input Registers",
@@ -787,31 +1008,65 @@ Built with Python, PyQt6, and pymodbus
                 )
             self.signals.log.emit("", "")
 
+            # One connection for the whole scan: every poll reuses it instead
+            # of reconnecting. After a continuous scan it is kept open for the
+            # next scan of the same device.
+            client = self._get_client(ip, port, timeout)
+            reconnect_delay = interval
+
+            # Registers the device rejected; later polls of this scan skip them
+            known_bad = {}
+
+            # Only cross the thread boundary when the bar actually moves. In
+            # continuous mode the intermediate stages are skipped, so after
+            # the first poll the bar simply stays at 100.
+            last_progress = None
+
+            def emit_progress(value):
+                nonlocal last_progress
+                if value != last_progress:
+                    last_progress = value
+                    self.signals.progress.emit(value)
+
             read_count = 0
             while self.scanning:
                 read_count += 1
+                poll_started = time.monotonic()
 
-                if continuous:
-                    self.signals.status.emit(
-                        f"Reading registers... (read #{read_count})"
-                    )
-                else:
+                # In continuous mode the poll's result status replaces any
+                # "reading" status within milliseconds, so only one is sent
+                if not continuous:
                     self.signals.status.emit(f"Connecting to {ip}:{port}...")
-
-                self.signals.progress.emit(25)
+                    emit_progress(25)
 
                 # Connect and read registers
                 if read_individually:
                     # Read each register individually
                     registers = self.read_registers_individually(
-                        ip, port, unit_id, timeout, register_type, start_reg, reg_count
+                        ip,
+                        port,
+                        unit_id,
+                        timeout,
+                        register_type,
+                        start_reg,
+                        reg_count,
+                        client=client,
+                        # Fill the bar between the 25 and 75 stages as blocks
+                        # (and bisected retries) come back
+                        on_progress=(
+                            None
+                            if continuous
+                            else lambda done: emit_progress(25 + int(50 * done))
+                        ),
+                        known_bad=known_bad,
                     )
 
-                    # Count successes and errors
-                    success_count = sum(1 for r in registers if not isinstance(r, dict))
-                    error_count = sum(1 for r in registers if isinstance(r, dict))
+                    # Count successes and errors (one pass over the results)
+                    error_count = sum(isinstance(r, dict) for r in registers)
+                    success_count = len(registers) - error_count
 
-                    self.signals.progress.emit(75)
+                    if not continuous:
+                        emit_progress(75)
 
                     if continuous:
                         self.signals.log.emit(
@@ -825,7 +1080,7 @@ Built with Python, PyQt6, and pymodbus
                         )
 
                     # Always update table with mixed results
-                    self.signals.update_table.emit(registers, start_reg)
+                    self._pending_snapshot.append((registers, start_reg))
 
                     if continuous:
                         self.signals.status.emit(
@@ -838,10 +1093,18 @@ Built with Python, PyQt6, and pymodbus
                 else:
                     # Read all registers in one request (original behavior)
                     result = self.read_registers(
-                        ip, port, unit_id, timeout, register_type, start_reg, reg_count
+                        ip,
+                        port,
+                        unit_id,
+                        timeout,
+                        register_type,
+                        start_reg,
+                        reg_count,
+                        client=client,
                     )
 
-                    self.signals.progress.emit(75)
+                    if not continuous:
+                        emit_progress(75)
 
                     if result["success"]:
                         if continuous:
@@ -854,7 +1117,7 @@ Built with Python, PyQt6, and pymodbus
                                 f"Successfully read {reg_count} registers", "success"
                             )
                         # Pass the protocol address (0-based) to populate_table
-                        self.signals.update_table.emit(result["registers"], start_reg)
+                        self._pending_snapshot.append((result["registers"], start_reg))
                         if continuous:
                             self.signals.status.emit(
                                 f"Continuous read active (#{read_count})"
@@ -869,22 +1132,92 @@ Built with Python, PyQt6, and pymodbus
                         if not continuous:
                             break
 
-                self.signals.progress.emit(100)
+                emit_progress(100)
 
                 # If not continuous mode, exit after one read
                 if not continuous:
                     break
 
-                # Wait for the interval before next read
+                # Wait for the interval before next read. The interval runs
+                # from the start of this poll, so the table refresh (on the GUI
+                # thread) and the read time don't stretch the polling period.
+                # While the device is unreachable, back off exponentially
+                # instead of reconnecting every interval.
                 if self.scanning and continuous:
-                    time.sleep(interval)
+                    if client.is_socket_open():
+                        reconnect_delay = interval
+                        self._sleep_while_scanning(
+                            interval - (time.monotonic() - poll_started)
+                        )
+                    else:
+                        self.signals.status.emit(
+                            f"Connection lost - retrying in {reconnect_delay:g} seconds"
+                        )
+                        self._sleep_while_scanning(reconnect_delay)
+                        reconnect_delay = min(reconnect_delay * 2, MAX_RECONNECT_DELAY)
 
         except Exception as e:
             self.signals.log.emit(f"Error: {str(e)}", "error")
             self.signals.status.emit("Operation failed")
+            # Start the next scan on a fresh connection
+            self._close_clients()
         finally:
+            # A single read is done with the device; don't hold one of its
+            # connection slots while the tool sits idle
+            if not config.continuous:
+                self._close_clients()
             self.signals.finished.emit()
 
+    def _get_client(self, ip, port, timeout):
+        """Return the kept-open client for a device, creating it on first use
+
+        Only the most recently scanned device keeps its connection; switching
+        devices closes the old one so idle sockets don't hold connection slots
+        on devices that allow only a few.
+        """
+        key = (ip, port, timeout)
+        client = self._clients.get(key)
+        if client is None:
+            self._close_clients()
+            client = ModbusTcpClient(ip, port=port, timeout=timeout)
+            self._clients[key] = client
+        return client
+
+    def _reconnect(self, client):
+        """Reopen a kept-open client's connection, returning True on success
+
+        A device may drop an idle connection between scans. pymodbus can't
+        tell (connect() only checks that a socket exists), so the first
+        request on the stale socket fails and the caller reconnects here.
+        """
+        client.close()
+        if not client.connect():
+            return False
+        _tune_socket(client)
+        return True
+
+    def _close_clients(self):
+        """Close and forget every kept-open device connection"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            client.close()
+
+    def closeEvent(self, event):
+        """Stop any running scan and close device connections on exit"""
+        self.scanning = False
+        self._close_clients()
+        super().closeEvent(event)
+
+    def _sleep_while_scanning(self, seconds):
+        """Sleep for up to the given time, returning early if the scan is stopped"""
+        deadline = time.monotonic() + seconds
+        while self.scanning:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 0.1))
+
     def populate_table(self, registers, start_address):
         """Populate the tree widget with register values (with expandable bit rows)"""
 
@@ -893,200 +1226,179 @@ Built with Python, PyQt6, and pymodbus
         reverse_word = self.reverse_word_order_check.isChecked()
         zero_based = self.zero_based_check.isChecked()
 
-        # Check if we're dealing with bit values (coils/discrete inputs)
-        is_bit_type = False
-        if len(registers) > 0:
-            first_valid = next((v for v in registers if not isinstance(v, dict)), None)
-            if first_valid is not None and isinstance(first_valid, bool):
-                is_bit_type = True
+        # Bit values (coils/discrete inputs) were fixed when the scan started
+        is_bit_type = self._scan_is_bit_type
+
+        # A stable device returns the same values poll after poll - leave the
+        # table alone unless the values or the way they are shown changed
+        snapshot = (registers, start_address, reverse_byte, reverse_word, zero_based)
+        if snapshot == self._last_snapshot and self.results_table.topLevelItemCount():
+            return
+
+        # Same block shown the same way - only registers that changed need new text
+        previous = None
+        if self._last_snapshot is not None and self._last_snapshot[1:] == snapshot[1:]:
+            previous = self._last_snapshot[0]
+        self._last_snapshot = snapshot
 
         # Check if this is first population or structure changed
         needs_rebuild = False
         if self.results_table.topLevelItemCount() != len(registers):
             needs_rebuild = True
 
-        # If structure hasn't changed, update in place
-        if not needs_rebuild and self.results_table.topLevelItemCount() > 0:
-            self._update_table_values(
-                registers,
-                start_address,
-                reverse_byte,
-                reverse_word,
-                zero_based,
-                is_bit_type,
-            )
-            return
+        self._invalidate_row_cache()
+
+        with self._batched_table_update():
+            # If structure hasn't changed, update in place
+            if not needs_rebuild and self.results_table.topLevelItemCount() > 0:
+                self._update_table_values(
+                    registers,
+                    start_address,
+                    reverse_byte,
+                    reverse_word,
+                    zero_based,
+                    is_bit_type,
+                    previous,
+                )
+            else:
+                # Otherwise rebuild the table
+                self._rebuild_table(
+                    registers,
+                    start_address,
+                    reverse_byte,
+                    reverse_word,
+                    zero_based,
+                    is_bit_type,
+                )
+
+    @contextlib.contextmanager
+    def _batched_table_update(self):
+        """Suspend repaints and item signals while the table is rewritten"""
+        table = self.results_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            yield
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
-        # Otherwise rebuild the table
+    def _rebuild_table(
+        self,
+        registers,
+        start_address,
+        reverse_byte,
+        reverse_word,
+        zero_based,
+        is_bit_type,
+    ):
+        """Recreate every table item (first read or when the register count changed)"""
         self.results_table.clear()
-        self.results_table.setHeaderLabels(
-            [
-                "Address",
-                "Tag Name",
-                "Hex",
-                "Binary",
-                "Uint16",
-                "Int16",
-                "Uint32",
-                "Int32",
-                "Float32",
-                "String",
-            ]
+        self.results_table.setHeaderLabels(list(COLUMN_HEADERS))
+
+        decoded = self._decode_for_display(
+            registers, reverse_byte, reverse_word, is_bit_type
         )
+        # Resolve the addressing mode once rather than per row
+        addr_base = start_address if zero_based else start_address + 1
+        bit_base = 0 if zero_based else 1
+        # Every editable row gets the same flags; work them out once
+        editable_flags = QTreeWidgetItem().flags() | Qt.ItemFlag.ItemIsEditable
+        register_tags = self._register_tags
+        bit_tags_by_address = self._bit_tags
+        no_bit_tags = {}
+
+        # Build every row detached from the tree, then insert them in one go
+        # so the view handles a single row insertion instead of one per item
+        top_level_items = []
 
         for i, value in enumerate(registers):
             # Calculate display address
-            addr = start_address + i
-            if not zero_based:
-                addr += 1  # Display as 1-based
+            addr = addr_base + i
 
             # Check if this is an error entry
             if isinstance(value, dict) and "error" in value:
-                item = QTreeWidgetItem(
-                    [
-                        str(addr),
-                        "ERROR",
-                        "ERROR",
-                        "ERROR",
-                        "ERROR",
-                        "ERROR",
-                        "ERROR",
-                        "ERROR",
-                        "ERROR",
-                        "ERROR",
-                    ]
-                )
+                item = QTreeWidgetItem([str(addr), *_ERR_COLS])
                 item.setToolTip(0, value["error"])
-                self.results_table.addTopLevelItem(item)
+                top_level_items.append(item)
                 continue
 
             # Handle bit values (coils/discrete inputs)
             if is_bit_type:
-                tag_name = self.tag_mappings.get((addr, None), "")
-                bit_val = "1" if value else "0"
-                item = QTreeWidgetItem(
-                    [str(addr), tag_name, bit_val, "-", "-", "-", "-", "-", "-", "-"]
-                )
-                self.results_table.addTopLevelItem(item)
+                tag_name = register_tags.get(addr, "")
+                bit_val = BIT_TEXT[value]
+                item = QTreeWidgetItem([str(addr), tag_name, bit_val, *BIT_ROW_TAIL])
+                top_level_items.append(item)
                 continue
 
-            # Apply byte order reversal if needed
-            if reverse_byte:
-                value = ((value & 0xFF) << 8) | ((value >> 8) & 0xFF)
-
-            # Create parent item for the register
-            hex_val = f"0x{value:04X}"
-            binary_val = format(value, "016b")
+            _, cells = decoded[i]
+            hex_val, binary_val = cells[0], cells[1]
 
             # Get tag for whole register
-            whole_reg_tag = self.tag_mappings.get((addr, None), "")
-
-            # Uint16, Int16
-            uint16_val = str(value)
-            int16_val = value if value < 32768 else value - 65536
-
-            # Uint32, Int32, Float32
-            uint32_str = "-"
-            int32_str = "-"
-            float32_str = "-"
-
-            if i + 1 < len(registers):
-                next_value = registers[i + 1]
-                if not (isinstance(next_value, dict) and "error" in next_value):
-                    if reverse_byte:
-                        next_value = ((next_value & 0xFF) << 8) | (
-                            (next_value >> 8) & 0xFF
-                        )
-
-                    if reverse_word:
-                        uint32_val = (next_value << 16) | value
-                    else:
-                        uint32_val = (value << 16) | next_value
-
-                    uint32_str = str(uint32_val)
-                    int32_val = (
-                        uint32_val
-                        if uint32_val < 2147483648
-                        else uint32_val - 4294967296
-                    )
-                    int32_str = str(int32_val)
-
-                    try:
-                        if reverse_word:
-                            bytes_data = struct.pack(">HH", next_value, value)
-                        else:
-                            bytes_data = struct.pack(">HH", value, next_value)
-                        float_val = struct.unpack(">f", bytes_data)[0]
-                        float32_str = f"{float_val:.6f}"
-                    except:
-                        float32_str = "N/A"
-
-            # String
-            try:
-                high_byte = (value >> 8) & 0xFF
-                low_byte = value & 0xFF
-                chars = []
-                if 32 <= high_byte <= 126:
-                    chars.append(chr(high_byte))
-                if 32 <= low_byte <= 126:
-                    chars.append(chr(low_byte))
-                string_val = "".join(chars) if chars else "."
-            except:
-                string_val = "."
+            whole_reg_tag = register_tags.get(addr, "")
 
             # Create parent item
-            parent_item = QTreeWidgetItem(
-                [
-                    str(addr),
-                    whole_reg_tag,
-                    hex_val,
-                    binary_val,
-                    uint16_val,
-                    str(int16_val),
-                    uint32_str,
-                    int32_str,
-                    float32_str,
-                    string_val,
-                ]
-            )
+            parent_item = QTreeWidgetItem([str(addr), whole_reg_tag, *cells])
 
             # Make Tag Name column editable
-            parent_item.setFlags(parent_item.flags() | Qt.ItemFlag.ItemIsEditable)
+            parent_item.setFlags(editable_flags)
 
-            self.results_table.addTopLevelItem(parent_item)
+            top_level_items.append(parent_item)
 
-            # Always add child items for all 16 bits
-            for bit in range(16):
-                bit_value = (value >> bit) & 1
+            # Always add child items for all 16 bits. The Binary text already
+            # holds every bit, most significant first, so read it backwards.
+            bit_items = []
+            bit_tags = bit_tags_by_address.get(addr, no_bit_tags)
+            for bit, bit_text in enumerate(reversed(binary_val)):
                 # Get tag for this bit if it exists
-                bit_tag = self.tag_mappings.get((addr, bit), "")
-
-                # Display bit number based on addressing mode
-                bit_display = bit + 1 if not zero_based else bit
+                bit_tag = bit_tags.get(bit, "")
 
                 bit_item = QTreeWidgetItem(
                     [
-                        f"{addr}.{bit_display}",
+                        f"{addr}.{bit + bit_base}",
                         bit_tag,
-                        str(bit_value),
+                        bit_text,
                         binary_val,  # Show full register binary for context
                         hex_val,  # Show full register hex for context
-                        "-",
-                        "-",
-                        "-",
-                        "-",
-                        "-",
+                        *BIT_CHILD_TAIL,
                     ]
                 )
                 # Make Tag Name editable for bit rows too
-                bit_item.setFlags(bit_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                parent_item.addChild(bit_item)
-
-            # Use auto_expand_bits preference for new items
-            if self.auto_expand_bits:
-                parent_item.setExpanded(True)
+                bit_item.setFlags(editable_flags)
+                bit_items.append(bit_item)
+            parent_item.addChildren(bit_items)
+
+        self.results_table.addTopLevelItems(top_level_items)
+
+        # Use auto_expand_bits preference for new items (items start collapsed;
+        # expansion only takes effect once they are in the tree)
+        if self.auto_expand_bits:
+            self.results_table.expandAll()
+
+        # Fit the columns to the new rows once; in-place value updates keep
+        # the widths (and any the user set by hand)
+        for col in range(self.results_table.columnCount()):
+            self.results_table.resizeColumnToContents(col)
+
+    def _index_tag_mappings(self):
+        """Split tag_mappings into per-address lookups used when rebuilding the table"""
+        self._register_tags = {}
+        self._bit_tags = {}
+        for (address, bit), tag_name in self.tag_mappings.items():
+            if bit is None:
+                self._register_tags[address] = tag_name
             else:
-                parent_item.setExpanded(False)
+                self._bit_tags.setdefault(address, {})[bit] = tag_name
+
+    def _decode_for_display(self, registers, reverse_byte, reverse_word, is_bit_type):
+        """Decode a whole block of registers at once (bit values need no decoding)"""
+        if is_bit_type:
+            return None
+        return decode_registers(
+            [None if isinstance(v, dict) else v for v in registers],
+            reverse_byte,
+            reverse_word,
+        )
 
     def _update_table_values(
         self,
@@ -1096,14 +1408,32 @@ Built with Python, PyQt6, and pymodbus
         reverse_word,
         zero_based,
         is_bit_type,
+        previous=None,
     ):
         """Update existing table items in place (preserves tag names, expansion state, scroll position)"""
 
+        # Rows are only skipped when the previous poll read the same block
+        if previous is not None and len(previous) != len(registers):
+            previous = None
+        last = len(registers) - 1
+
+        decoded = self._decode_for_display(
+            registers, reverse_byte, reverse_word, is_bit_type
+        )
+        addr_base = start_address if zero_based else start_address + 1
+        bit_base = 0 if zero_based else 1
+
         for i, value in enumerate(registers):
+            # Unchanged register - the 32-bit columns also need the next one unchanged
+            if (
+                previous is not None
+                and previous[i] == value
+                and (i == last or previous[i + 1] == registers[i + 1])
+            ):
+                continue
+
             # Calculate display address
-            addr = start_address + i
-            if not zero_based:
-                addr += 1  # Display as 1-based
+            addr = addr_base + i
 
             # Get the existing parent item
             parent_item = self.results_table.topLevelItem(i)
@@ -1113,163 +1443,91 @@ Built with Python, PyQt6, and pymodbus
             # Check if this is an error entry
             if isinstance(value, dict) and "error" in value:
                 parent_item.setText(0, str(addr))
-                parent_item.setText(2, "ERROR")
-                parent_item.setText(3, "ERROR")
-                parent_item.setText(4, "ERROR")
-                parent_item.setText(5, "ERROR")
-                parent_item.setText(6, "ERROR")
-                parent_item.setText(7, "ERROR")
-                parent_item.setText(8, "ERROR")
-                parent_item.setText(9, "ERROR")
+                # Column 1 (Tag Name) is NOT updated - preserves user edits.
+                # Only touch cells that aren't already showing ERROR.
+                for col, text in enumerate(_ERR_COLS[1:], start=2):
+                    if parent_item.text(col) != text:
+                        parent_item.setText(col, text)
                 parent_item.setToolTip(0, value["error"])
                 continue
 
             # Handle bit values (coils/discrete inputs)
             if is_bit_type:
-                bit_val = "1" if value else "0"
+                bit_val = BIT_TEXT[value]
                 parent_item.setText(0, str(addr))
                 parent_item.setText(2, bit_val)
-                parent_item.setText(3, "-")
-                parent_item.setText(4, "-")
-                parent_item.setText(5, "-")
-                parent_item.setText(6, "-")
-                parent_item.setText(7, "-")
-                parent_item.setText(8, "-")
-                parent_item.setText(9, "-")
+                for col, text in enumerate(BIT_ROW_TAIL, start=3):
+                    if parent_item.text(col) != text:
+                        parent_item.setText(col, text)
                 continue
 
-            # Apply byte order reversal if needed
-            if reverse_byte:
-                value = ((value & 0xFF) << 8) | ((value >> 8) & 0xFF)
-
-            # Update parent item values
-            hex_val = f"0x{value:04X}"
-            binary_val = format(value, "016b")
-            uint16_val = str(value)
-            int16_val = value if value < 32768 else value - 65536
-
-            # Uint32, Int32, Float32
-            uint32_str = "-"
-            int32_str = "-"
-            float32_str = "-"
-
-            if i + 1 < len(registers):
-                next_value = registers[i + 1]
-                if not (isinstance(next_value, dict) and "error" in next_value):
-                    if reverse_byte:
-                        next_value = ((next_value & 0xFF) << 8) | (
-                            (next_value >> 8) & 0xFF
-                        )
+            _, cells = decoded[i]
+            hex_val, binary_val = cells[0], cells[1]
 
-                    if reverse_word:
-                        uint32_val = (next_value << 16) | value
-                    else:
-                        uint32_val = (value << 16) | next_value
+            # Update parent item (preserve column 1 - Tag Name)
+            parent_item.setText(0, str(addr))
+            # Column 1 (Tag Name) is NOT updated - preserves user edits
+            for col, text in enumerate(cells, start=2):
+                parent_item.setText(col, text)
 
-                    uint32_str = str(uint32_val)
-                    int32_val = (
-                        uint32_val
-                        if uint32_val < 2147483648
-                        else uint32_val - 4294967296
-                    )
-                    int32_str = str(int32_val)
+            # Update child bit items (bit 0 is the last Binary character)
+            bit_texts = binary_val[::-1]
+            for bit in range(min(16, parent_item.childCount())):
+                bit_item = parent_item.child(bit)
 
-                    try:
-                        if reverse_word:
-                            bytes_data = struct.pack(">HH", next_value, value)
-                        else:
-                            bytes_data = struct.pack(">HH", value, next_value)
-                        float_val = struct.unpack(">f", bytes_data)[0]
-                        float32_str = f"{float_val:.6f}"
-                    except:
-                        float32_str = "N/A"
+                # Update bit item (preserve column 1 - Tag Name)
+                bit_item.setText(0, f"{addr}.{bit + bit_base}")
+                # Column 1 (Tag Name) is NOT updated - preserves user edits
+                bit_item.setText(2, bit_texts[bit])
+                bit_item.setText(3, binary_val)
+                bit_item.setText(4, hex_val)
 
-            # String
-            try:
-                high_byte = (value >> 8) & 0xFF
-                low_byte = value & 0xFF
-                chars = []
-                if 32 <= high_byte <= 126:
-                    chars.append(chr(high_byte))
-                if 32 <= low_byte <= 126:
-                    chars.append(chr(low_byte))
-                string_val = "".join(chars) if chars else "."
-            except:
-                string_val = "."
+    def _read_block(self, client, register_type, address, count, unit_id):
+        """Issue a single read request for count registers/bits starting at address"""
+        return self._bind_reader(client, register_type, unit_id)(address, count=count)
 
-            # Update parent item (preserve column 1 - Tag Name)
-            parent_item.setText(0, str(addr))
-            # Column 1 (Tag Name) is NOT updated - preserves user edits
-            parent_item.setText(2, hex_val)
-            parent_item.setText(3, binary_val)
-            parent_item.setText(4, uint16_val)
-            parent_item.setText(5, str(int16_val))
-            parent_item.setText(6, uint32_str)
-            parent_item.setText(7, int32_str)
-            parent_item.setText(8, float32_str)
-            parent_item.setText(9, string_val)
-
-            # Update child bit items
-            for bit in range(16):
-                if bit < parent_item.childCount():
-                    bit_item = parent_item.child(bit)
-                    bit_value = (value >> bit) & 1
-
-                    # Display bit number based on addressing mode
-                    bit_display = bit + 1 if not zero_based else bit
-
-                    # Update bit item (preserve column 1 - Tag Name)
-                    bit_item.setText(0, f"{addr}.{bit_display}")
-                    # Column 1 (Tag Name) is NOT updated - preserves user edits
-                    bit_item.setText(2, str(bit_value))
-                    bit_item.setText(3, binary_val)
-                    bit_item.setText(4, hex_val)
+    def _bind_reader(self, client, register_type, unit_id):
+        """Return the client's read method for register_type with the unit ID bound
+
+        Call the result as read(address, count=n).
+        """
+        method = getattr(client, READ_METHODS[register_type])
+        if UNIT_ID_KEYWORD:
+            return functools.partial(method, **{UNIT_ID_KEYWORD: unit_id})
+        return method
 
     def read_registers(
-        self, ip, port, unit_id, timeout, register_type, start_reg, count
+        self, ip, port, unit_id, timeout, register_type, start_reg, count, client=None
     ):
-        """Read registers from a Modbus device"""
+        """Read registers from a Modbus device
+
+        A caller-supplied client is (re)connected if needed and left open for
+        reuse; otherwise a temporary connection is opened and closed here.
+        """
         result = {"success": False, "registers": None, "error": None}
+        owns_client = client is None
 
         try:
-            client = ModbusTcpClient(ip, port=port, timeout=timeout)
+            if owns_client:
+                client = ModbusTcpClient(ip, port=port, timeout=timeout)
 
             if not client.connect():
                 result["error"] = "Failed to connect to device"
                 return result
+            _tune_socket(client)
 
             try:
-                # Try different parameter names for different pymodbus versions
-                response = None
-                for param_style in [
-                    ("slave", unit_id),
-                    ("unit", unit_id),
-                    (None, None),
-                ]:
-                    try:
-                        param_name, param_value = param_style
-                        if param_name:
-                            kwargs = {"count": count, param_name: param_value}
-                        else:
-                            kwargs = {"count": count}
-
-                        if register_type == "holding":
-                            response = client.read_holding_registers(
-                                start_reg, **kwargs
-                            )
-                        elif register_type == "input":
-                            response = client.read_input_registers(start_reg, **kwargs)
-                        elif register_type == "coils":
-                            response = client.read_coils(start_reg, **kwargs)
-                        else:  # discrete inputs
-                            response = client.read_discrete_inputs(start_reg, **kwargs)
-                        break  # If successful, exit the loop
-                    except TypeError:
-                        continue  # Try next parameter style
-
-                if response is None:
-                    raise Exception(
-                        "Could not call read function with any known parameter style"
+                try:
+                    response = self._read_block(
+                        client, register_type, start_reg, count, unit_id
+                    )
+                except Exception:
+                    # Transport error on a kept-open connection - retry once
+                    # on a fresh one (Modbus error responses don't raise)
+                    if owns_client or not self._reconnect(client):
+                        raise
+                    response = self._read_block(
+                        client, register_type, start_reg, count, unit_id
                     )
 
                 if response.isError():
@@ -1278,16 +1536,19 @@ Built with Python, PyQt6, and pymodbus
                     result["success"] = True
                     # For coils and discrete inputs, use .bits instead of .registers
                     if register_type in ["coils", "discrete"]:
-                        result["registers"] = response.bits[
-                            :count
-                        ]  # Only take the requested count
+                        # Bits come padded to a whole byte; drop the padding
+                        # in place rather than copying the list
+                        bits = response.bits
+                        del bits[count:]
+                        result["registers"] = bits
                     else:
                         result["registers"] = response.registers
 
             except Exception as e:
                 result["error"] = f"Failed to read registers: {str(e)}"
             finally:
-                client.close()
+                if owns_client:
+                    client.close()
 
         except Exception as e:
             result["error"] = f"Connection error: {str(e)}"
@@ -1295,82 +1556,141 @@ Built with Python, PyQt6, and pymodbus
         return result
 
     def read_registers_individually(
-        self, ip, port, unit_id, timeout, register_type, start_reg, count
+        self,
+        ip,
+        port,
+        unit_id,
+        timeout,
+        register_type,
+        start_reg,
+        count,
+        client=None,
+        on_progress=None,
+        known_bad=None,
     ):
-        """Read registers one at a time, continuing even if some fail"""
-        results = []
+        """Read a register range, isolating individual registers that fail
+
+        The range is fetched in as few block requests as possible. A block the
+        device rejects is split in half and retried until the failing
+        registers are isolated, so a missing register costs a few extra
+        requests rather than one request for every register in the range.
+        on_progress, if given, is called with the fraction of the range
+        resolved so far after every request.
+
+        known_bad, if given, maps addresses the device reported as illegal
+        data addresses on earlier polls to their error entry. Those addresses
+        are not requested again and newly isolated ones are added to it.
+        """
+        owns_client = client is None
 
-        client = ModbusTcpClient(ip, port=port, timeout=timeout)
+        if owns_client:
+            client = ModbusTcpClient(ip, port=port, timeout=timeout)
 
         if not client.connect():
             # If can't connect at all, return all errors
-            for i in range(count):
-                results.append({"error": "Failed to connect to device"})
-            return results
+            return [CONNECT_FAILED] * count
+        _tune_socket(client)
+
+        is_bits = register_type in ["coils", "discrete"]
+        max_span = MAX_BITS_PER_READ if is_bits else MAX_REGISTERS_PER_READ
+        # One slot per register, filled in by block as responses come back
+        results = [None] * count
+        resolved = 0
+        # Resolve the read method once, not per request
+        read = self._bind_reader(client, register_type, unit_id)
+
+        addresses = range(start_reg, start_reg + count)
+        if known_bad:
+            # Fill in the known failures and plan blocks around them (each
+            # block stops short of a bad address)
+            for addr in addresses:
+                if addr in known_bad:
+                    results[addr - start_reg] = known_bad[addr]
+                    resolved += 1
+            pending = _plan_reads(
+                [a for a in addresses if a not in known_bad], max_span=max_span
+            )
+        else:
+            pending = _plan_reads(addresses, max_span=max_span)
+        # Work through the planned blocks in address order (pop from the end)
+        pending.reverse()
+        # A caller-supplied client gets one reconnect per call
+        can_reconnect = not owns_client
 
         try:
-            for i in range(count):
-                reg_addr = start_reg + i
+            while pending:
+                if on_progress is not None:
+                    on_progress(resolved / count)
+                span_start, span_count = pending.pop()
+                offset = span_start - start_reg
                 try:
-                    # Try different parameter names for different pymodbus versions
-                    response = None
-                    for param_style in [
-                        ("slave", unit_id),
-                        ("unit", unit_id),
-                        (None, None),
-                    ]:
-                        try:
-                            param_name, param_value = param_style
-                            if param_name:
-                                kwargs = {"count": 1, param_name: param_value}
-                            else:
-                                kwargs = {"count": 1}
-
-                            if register_type == "holding":
-                                response = client.read_holding_registers(
-                                    reg_addr, **kwargs
-                                )
-                            elif register_type == "input":
-                                response = client.read_input_registers(
-                                    reg_addr, **kwargs
-                                )
-                            elif register_type == "coils":
-                                response = client.read_coils(reg_addr, **kwargs)
-                            else:  # discrete inputs
-                                response = client.read_discrete_inputs(
-                                    reg_addr, **kwargs
-                                )
-                            break  # If successful, exit the loop
-                        except TypeError:
-                            continue  # Try next parameter style
-
-                    if response is None:
-                        results.append(
-                            {
-                                "error": "Could not call read function with any known parameter style"
-                            }
-                        )
-                        continue
-
-                    if response.isError():
-                        results.append({"error": f"Modbus error: {response}"})
-                    else:
-                        # For coils and discrete inputs, use .bits[0] instead of .registers[0]
-                        if register_type in ["coils", "discrete"]:
-                            results.append(response.bits[0])
-                        else:
-                            results.append(response.registers[0])
-
+                    response = read(span_start, count=span_count)
                 except Exception as e:
-                    results.append({"error": f"{str(e)}"})
+                    # The kept-open connection may have gone stale - retry the
+                    # block once on a fresh one
+                    if can_reconnect:
+                        can_reconnect = False
+                        if self._reconnect(client):
+                            pending.append((span_start, span_count))
+                            continue
+                    # Transport failure - splitting the block won't help. The
+                    # whole span shares one error entry.
+                    error = {"error": f"{str(e)}"}
+                    results[offset : offset + span_count] = [error] * span_count
+                    resolved += span_count
+                    continue
+
+                if response.isError():
+                    error = {"error": f"Modbus error: {response}"}
+                    exception_code = getattr(response, "exception_code", None)
+                else:
+                    block = response.bits if is_bits else response.registers
+                    if len(block) >= span_count:
+                        # Slice to span_count, dropping the padding of bit blocks
+                        results[offset : offset + span_count] = block[:span_count]
+                        resolved += span_count
+                        continue
+                    # A short response can't be matched up with the addresses;
+                    # treat it like a rejected block
+                    error = {
+                        "error": f"Device returned {len(block)} of {span_count} values"
+                    }
+                    exception_code = None
+
+                if span_count == 1:
+                    results[offset] = error
+                    resolved += 1
+                    # Busy/device failure/gateway errors may clear on a later
+                    # poll; only a missing address is skipped from now on
+                    if known_bad is not None and exception_code == ILLEGAL_DATA_ADDRESS:
+                        known_bad[span_start] = error
+                elif exception_code == ILLEGAL_FUNCTION:
+                    # Every smaller request would be rejected the same way
+                    results[offset : offset + span_count] = [error] * span_count
+                    resolved += span_count
+                else:
+                    half = span_count // 2
+                    pending.append((span_start + half, span_count - half))
+                    pending.append((span_start, half))
 
         finally:
-            client.close()
+            if owns_client:
+                client.close()
 
         return results
 
+    def _flush_table_update(self):
+        """Show the most recent register snapshot from the worker, if any"""
+        try:
+            registers, start_address = self._pending_snapshot.pop()
+        except IndexError:
+            return
+        self.populate_table(registers, start_address)
+
     def scan_finished(self):
         """Called when scan is finished"""
+        self._table_refresh_timer.stop()
+        self._flush_table_update()
         self.scan_button.setEnabled(True)
         self.stop_button.setEnabled(False)
 
@@ -1383,22 +1703,26 @@ Built with Python, PyQt6, and pymodbus
         filename = f"modbus_registers_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
         try:
-            with open(filename, "w") as f:
-                # Write header
-                headers = []
-                for col in range(self.results_table.columnCount()):
-                    headers.append(self.results_table.headerItem().text(col))
-                f.write(",".join(headers) + "\n")
-
-                # Write data (iterate through tree items)
-                iterator = QTreeWidgetItemIterator(self.results_table)
-                while iterator.value():
-                    item = iterator.value()
-                    row_data = []
-                    for col in range(self.results_table.columnCount()):
-                        row_data.append(item.text(col))
-                    f.write(",".join(row_data) + "\n")
-                    iterator += 1
+            # Render the whole CSV in memory first so the file gets a single write
+            # (platform line endings and locale encoding, as a text-mode file)
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator=os.linesep)
+            # Write header
+            writer.writerow(COLUMN_HEADERS)
+            # Reuse the row text the filter caches (same order as the tree);
+            # a second export of an unchanged table doesn't touch Qt at all
+            writer.writerows(texts for _, texts, _ in self._cached_rows())
+
+            # QSaveFile writes to a temporary file and only replaces the target
+            # on commit, so a failed export never leaves a truncated CSV
+            save_file = QSaveFile(filename)
+            if not save_file.open(QIODevice.OpenModeFlag.WriteOnly):
+                raise OSError(save_file.errorString())
+            save_file.write(
+                buffer.getvalue().encode(locale.getpreferredencoding(False))
+            )
+            if not save_file.commit():
+                raise OSError(save_file.errorString())
 
             QMessageBox.information(self, "Export", f"Results exported to {filename}")
         except Exception as e:
@@ -1445,10 +1769,11 @@ Built with Python, PyQt6, and pymodbus
 
             # Store tag mappings for display
             # Create a lookup dict: (address, bit) -> tag_name
-            self.tag_mappings = {}
-            for tag in config.get("tags", []):
-                key = (tag["address"], tag.get("bit"))
-                self.tag_mappings[key] = tag["tag_name"]
+            self.tag_mappings = {
+                (tag["address"], tag.get("bit")): tag["tag_name"]
+                for tag in config.get("tags", [])
+            }
+            self._index_tag_mappings()
 
             # Update tags imported flag
             if self.tag_mappings:
@@ -7,6 +7,23 @@ Extracts device connection info and register mappings from KEPServerEX project f
 import re
 import struct
 
+# Maps printable ASCII (0x20-0x7E) to itself and every other byte to NUL, so
+# the printable runs of a file can be split out in C
+_PRINTABLE_TABLE = bytes(b if 0x20 <= b <= 0x7E else 0 for b in range(256))
+
+# Patterns are applied to every extracted string, so compile them once
+# One IPv4 octet, 0-255 (up to three digits, leading zeros allowed)
+_OCTET = r'(?:25[0-5]|2[0-4]\d|[01]?\d?\d)'
+_IP_UNIT_RE = re.compile(r'<(' + r'\.'.join([_OCTET] * 4) + r')>(?:\.(\d+))?')  # <IP> or <IP>.unitID
+_REG_FIND_RE = re.compile(r'4(\d{4})(?:\.(\d+))?')
+_REG_FULL_RE = re.compile(r'^4(\d{4})(?:\.(\d+))?$')
+_TAG_NAME_RE = re.compile(r'^[\d_\-a-zA-Z][\w\s\-]*$')
+_SKIP_RE = re.compile('|'.join([
+    r'^Rack \d+ - Slot \d+ - \d+$',  # Skip description-like strings
+    r'^\*\.txt$',  # Skip file patterns
+    r'^V\d+\.\d+',  # Skip version strings
+]))
+
 
 class OPFParser:
     """Parser for KEPServerEX .opf binary files"""
@@ -15,6 +32,7 @@ class OPFParser:
         self.file_path = file_path
         self.data = None
         self.strings = []
+        self._scan = None  # Cached _scan_strings() result
 
     def load(self):
         """Load the .opf file into memory"""
@@ -26,55 +44,54 @@ class OPFParser:
         if not self.data:
             self.load()
 
-        # Pattern to find printable ASCII strings
-        pattern = b'[\x20-\x7E]{' + str(min_length).encode() + b',}'
-        self.strings = [s.decode('ascii') for s in re.findall(pattern, self.data)]
+        # Blank out non-printable bytes, then split on them
+        runs = self.data.translate(_PRINTABLE_TABLE).split(b'\x00')
+        self.strings = [s.decode('ascii') for s in runs if len(s) >= min_length]
+        self._scan = None
         return self.strings
 
     def find_ip_addresses(self):
         """Find IP addresses in the file"""
-        if not self.strings:
-            self.extract_strings()
-
-        ip_pattern = r'<(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})>'
-        ips = []
-
-        for s in self.strings:
-            matches = re.findall(ip_pattern, s)
-            for match in matches:
-                # Validate IP
-                parts = match.split('.')
-                if all(0 <= int(p) <= 255 for p in parts):
-                    ips.append(match)
-
-        return ips
+        return list(self._scan_strings()[0])
 
     def find_unit_ids(self):
         """Find unit IDs associated with IP addresses"""
-        if not self.strings:
-            self.extract_strings()
+        return list(self._scan_strings()[1])
 
-        # Pattern: <IP>.unitID
-        pattern = r'<\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}>\.(\d+)'
-        unit_ids = []
+    def find_register_addresses(self):
+        """Find Modbus register addresses (format: 40001, 40001.0, etc.)"""
+        return list(self._scan_strings()[2])
 
-        for s in self.strings:
-            matches = re.findall(pattern, s)
-            unit_ids.extend([int(m) for m in matches])
+    def find_tag_mappings(self):
+        """Find tag names with their associated register addresses and bit positions"""
+        return list(self._scan_strings()[3])
 
-        return unit_ids
+    def _scan_strings(self):
+        """Collect IPs, unit IDs, registers and tags in a single pass over the strings
 
-    def find_register_addresses(self):
-        """Find Modbus register addresses (format: 40001, 40001.0, etc.)"""
+        The result is cached until the strings are extracted again.
+        """
         if not self.strings:
             self.extract_strings()
+        if self._scan is not None:
+            return self._scan
 
-        register_pattern = r'4(\d{4})(?:\.(\d+))?'
+        ips = []
+        unit_ids = []
         registers = []
-
-        for s in self.strings:
-            matches = re.findall(register_pattern, s)
-            for match in matches:
+        tag_mappings = []
+        # Each string is checked as a tag's register address by up to three
+        # earlier strings, so match it once up front
+        reg_matches = [_REG_FULL_RE.match(s) for s in self.strings]
+
+        for i, s in enumerate(self.strings):
+            # Only valid IPs match, so no per-octet check is needed
+            for ip, unit_id in _IP_UNIT_RE.findall(s):
+                ips.append(ip)
+                if unit_id:
+                    unit_ids.append(int(unit_id))
+
+            for match in _REG_FIND_RE.findall(s):
                 reg_num = int(match[0])
                 bit_num = int(match[1]) if match[1] else None
 
@@ -87,70 +104,56 @@ class OPFParser:
                 }
                 registers.append(reg_info)
 
-        return registers
+            tag = self._tag_at(i, reg_matches)
+            if tag:
+                tag_mappings.append(tag)
 
-    def find_tag_mappings(self):
-        """Find tag names with their associated register addresses and bit positions"""
-        if not self.strings:
-            self.extract_strings()
+        self._scan = (ips, unit_ids, registers, tag_mappings)
+        return self._scan
 
-        tag_mappings = []
-        register_pattern = r'^4(\d{4})(?:\.(\d+))?$'
-        skip_patterns = [
-            r'^Rack \d+ - Slot \d+ - \d+$',  # Skip description-like strings
-            r'^\*\.txt$',  # Skip file patterns
-            r'^V\d+\.\d+',  # Skip version strings
-        ]
-
-        # Look for pattern: TagName, Description, RegisterAddress
-        i = 0
-        while i < len(self.strings):
-            s = self.strings[i]
-
-            # Skip strings that match skip patterns
-            if any(re.match(pattern, s) for pattern in skip_patterns):
-                i += 1
-                continue
-
-            # Check if this string looks like a tag name (contains letters, numbers, spaces, hyphens, underscores)
-            if len(s) > 3 and re.match(r'^[\d_\-a-zA-Z][\w\s\-]*$', s):
-                # Look ahead for register address within next 3 strings
-                for j in range(1, min(4, len(self.strings) - i)):
-                    next_str = self.strings[i + j]
-                    match = re.match(register_pattern, next_str)
-
-                    if match:
-                        reg_num = int(match.group(1))
-                        bit_num = int(match.group(2)) if match.group(2) else None
-
-                        # Get description if available (usually between tag name and address)
-                        description = None
-                        if j == 2 and i + 1 < len(self.strings):
-                            desc_candidate = self.strings[i + 1]
-                            if not re.match(register_pattern, desc_candidate):
-                                description = desc_candidate
-
-                        tag_mappings.append({
-                            'tag_name': s,
-                            'description': description,
-                            'address': reg_num,
-                            'bit': bit_num,
-                            'type': 'holding'
-                        })
-                        break
-
-            i += 1
-
-        return tag_mappings
+    def _tag_at(self, i, reg_matches):
+        """Tag mapping starting at string i, or None
+
+        Looks for the pattern: TagName, Description, RegisterAddress.
+        reg_matches holds the _REG_FULL_RE match (or None) of every string.
+        """
+        s = self.strings[i]
+
+        # Skip strings that match skip patterns
+        if _SKIP_RE.match(s):
+            return None
+
+        # Check if this string looks like a tag name (contains letters, numbers, spaces, hyphens, underscores)
+        if len(s) > 3 and _TAG_NAME_RE.match(s):
+            # Look ahead for register address within next 3 strings
+            for j in range(1, min(4, len(self.strings) - i)):
+                match = reg_matches[i + j]
+
+                if match:
+                    reg_num = int(match.group(1))
+                    bit_num = int(match.group(2)) if match.group(2) else None
+
+                    # Get description if available (usually between tag name and address)
+                    description = None
+                    if j == 2 and i + 1 < len(self.strings):
+                        if not reg_matches[i + 1]:
+                            description = self.strings[i + 1]
+
+                    return {
+                        'tag_name': s,
+                        'description': description,
+                        'address': reg_num,
+                        'bit': bit_num,
+                        'type': 'holding'
+                    }
+
+        return None
 
     def parse(self):
         """Parse the .opf file and extract all relevant information"""
         self.extract_strings()
 
-        ips = self.find_ip_addresses()
-        unit_ids = self.find_unit_ids()
-        registers = self.find_register_addresses()
-        tag_mappings = self.find_tag_mappings()
+        ips, unit_ids, registers, tag_mappings = self._scan_strings()
 
         # Get unique register addresses (ignore bit positions for now)
         unique_regs = {}
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Modbus Register Decoder
+Converts blocks of raw 16-bit register values into the display columns of the results table
+"""
+
+import struct
+import sys
+from array import array
+
+# array typecodes for 32-bit integers (C int is 32 bits on every supported
+# platform; fall back to long where it isn't)
+_U32, _I32 = ("I", "i") if array("I").itemsize == 4 else ("L", "l")
+
+
+def _decode_pairs(words, reverse_word):
+    """Decode every overlapping register pair as uint32, int32 and float32
+
+    Entry i combines register i with register i + 1, so a block of N
+    registers yields N - 1 values per type.
+    """
+    pair_count = len(words) - 1
+    if pair_count < 1:
+        return [], [], []
+
+    # With word order reversed, register i + 1 is the high word. Reversing the
+    # whole block turns that into the normal high-then-low layout.
+    ordered = array("H", reversed(words)) if reverse_word else array("H", words)
+    if sys.byteorder == "little":
+        ordered.byteswap()  # Modbus data is big-endian
+    data = ordered.tobytes()
+
+    # Pairs overlap (0-1, 1-2, 2-3, ...) but struct only unpacks consecutive
+    # items, so pairs starting on even and odd registers are unpacked separately
+    even_count = (pair_count + 1) // 2
+    odd_count = pair_count // 2
+
+    uint32_values = [0] * pair_count
+    uint32_values[0::2] = struct.unpack_from(f">{even_count}I", data, 0)
+    uint32_values[1::2] = struct.unpack_from(f">{odd_count}I", data, 2)
+    if reverse_word:
+        uint32_values.reverse()
+
+    # Int32 and Float32 are the same 32 bits reinterpreted, not recomputed
+    raw = array(_U32, uint32_values).tobytes()
+    return uint32_values, array(_I32, raw), array("f", raw)
+
+
+# String column text of each byte: the character if printable ASCII, else ""
+_BYTE_TEXT = tuple(chr(b) if 32 <= b <= 126 else "" for b in range(256))
+
+
+def decode_registers(registers, reverse_byte=False, reverse_word=False):
+    """Decode a block of 16-bit registers into table columns
+
+    Args:
+        registers: Register values in address order; None marks a register that failed to read
+        reverse_byte: Swap the two bytes of every register
+        reverse_word: Use the following register as the high word of 32-bit values
+
+    Returns:
+        list: One entry per register. None for failed registers, otherwise a
+        (value, cells) tuple where value is the byte-order-adjusted register and
+        cells holds the Hex, Binary, Uint16, Int16, Uint32, Int32, Float32 and
+        String column text.
+    """
+    words = array("H", [0 if r is None else r for r in registers])
+    if reverse_byte:
+        words.byteswap()
+
+    # Reinterpret the same 16-bit words as signed values (no per-value arithmetic)
+    int16_values = array("h", words.tobytes())
+    uint32_values, int32_values, float32_values = _decode_pairs(words, reverse_word)
+    pair_count = len(uint32_values)
+
+    rows = []
+    for i, raw in enumerate(registers):
+        if raw is None:
+            rows.append(None)
+            continue
+
+        value = words[i]
+
+        # 32-bit columns need this register and the next one
+        if i < pair_count and registers[i + 1] is not None:
+            uint32_str = str(uint32_values[i])
+            int32_str = str(int32_values[i])
+            float32_str = f"{float32_values[i]:.6f}"
+        else:
+            uint32_str = "-"
+            int32_str = "-"
+            float32_str = "-"
+
+        rows.append(
+            (
+                value,
+                [
+                    f"0x{value:04X}",
+                    format(value, "016b"),
+                    str(value),
+                    str(int16_values[i]),
+                    uint32_str,
+                    int32_str,
+                    float32_str,
+                    (_BYTE_TEXT[value >> 8] + _BYTE_TEXT[value & 0xFF]) or ".",
+                ],
+            )
+        )
+
+    return rows
@@ -10,6 +10,26 @@ from unittest.mock import Mock, MagicMock
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+def pytest_addoption(parser):
+    """Add the --network option for tests that contact external services"""
+    parser.addoption(
+        "--network",
+        action="store_true",
+        default=False,
+        help="run tests marked network (they send requests to external services)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network tests unless --network was given"""
+    if config.getoption("--network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --network option to run")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
 @pytest.fixture(scope="session")
 def qapp():
     """Create QApplication instance for GUI tests"""
@@ -78,6 +98,19 @@ def temp_file(tmp_path):
     return _create_temp_file
 
 
+@pytest.fixture(scope="session")
+def host_platform_info():
+    """OS and Python version details of this machine (collected once per session)"""
+    import platform
+
+    return {
+        "os": platform.system(),
+        "os_version": platform.version(),
+        "os_release": platform.release(),
+        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+    }
+
+
 @pytest.fixture(scope="session")
 def modbus_test_server():
     """Fixture providing a test Modbus server (optional - requires server running)"""
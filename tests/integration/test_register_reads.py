@@ -0,0 +1,269 @@
+"""
+Integration tests for the scanner's register read paths (mocked Modbus client)
+"""
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+
+
+def make_client(bad_addresses=(), exception_code=2):
+    """Mock client that rejects any block touching one of bad_addresses
+
+    Rejections carry exception_code (2 = Illegal Data Address by default).
+    """
+    client = MagicMock()
+    client.connect.return_value = True
+
+    def read(address, count=1, **kwargs):
+        if any(a in bad_addresses for a in range(address, address + count)):
+            return Mock(isError=Mock(return_value=True), exception_code=exception_code)
+        return Mock(
+            isError=Mock(return_value=False),
+            registers=list(range(address, address + count)),
+            bits=[bool(a % 2) for a in range(address, address + count)],
+        )
+
+    client.read_holding_registers.side_effect = read
+    client.read_input_registers.side_effect = read
+    client.read_coils.side_effect = read
+    client.read_discrete_inputs.side_effect = read
+    return client
+
+
+@pytest.mark.integration
+class TestReadIndividually:
+    """Test read_registers_individually block reads with error isolation"""
+
+    @pytest.fixture
+    def main_window(self, qapp, mock_modbus_client):
+        """Create main window instance for testing"""
+        with patch('modscan_tool.ModbusTcpClient', return_value=mock_modbus_client):
+            from modscan_tool import ModbusScannerGUI
+            window = ModbusScannerGUI(version="1.4.0")
+            yield window
+            window.close()
+
+    def test_all_registers_in_one_request(self, main_window):
+        """Test a healthy range is read with a single request"""
+        client = make_client()
+        results = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 20, client=client
+        )
+
+        assert results == list(range(20))
+        assert client.read_holding_registers.call_count == 1
+
+    def test_bad_register_is_isolated(self, main_window):
+        """Test a rejected register only errors that address"""
+        client = make_client(bad_addresses={5})
+        results = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 20, client=client
+        )
+
+        assert isinstance(results[5], dict) and "error" in results[5]
+        assert [r for i, r in enumerate(results) if i != 5] == [
+            i for i in range(20) if i != 5
+        ]
+        assert client.read_holding_registers.call_count < 20
+
+    def test_known_bad_registers_skipped_next_poll(self, main_window):
+        """Test registers isolated on one poll aren't bisected again"""
+        client = make_client(bad_addresses={5})
+        known_bad = {}
+        first = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 20,
+            client=client, known_bad=known_bad,
+        )
+        assert set(known_bad) == {5}
+
+        client.read_holding_registers.reset_mock()
+        second = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 20,
+            client=client, known_bad=known_bad,
+        )
+
+        assert second == first
+        assert client.read_holding_registers.call_count == 2
+
+    def test_busy_register_reread_next_poll(self, main_window):
+        """Test a register that failed with a temporary error isn't skipped later"""
+        client = make_client(bad_addresses={5}, exception_code=6)  # Device busy
+        known_bad = {}
+        main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 20,
+            client=client, known_bad=known_bad,
+        )
+        assert known_bad == {}
+
+        # The device has recovered by the next poll
+        client = make_client()
+        results = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 20,
+            client=client, known_bad=known_bad,
+        )
+
+        assert results == list(range(20))
+
+    def test_short_response_not_accepted(self, main_window):
+        """Test a block answered with too few values doesn't shift the results"""
+        client = make_client()
+        read = client.read_holding_registers.side_effect
+
+        def short_read(address, count=1, **kwargs):
+            response = read(address, count=count)
+            if count > 1:
+                response.registers = response.registers[:-1]
+            return response
+
+        client.read_holding_registers.side_effect = short_read
+        results = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 8, client=client
+        )
+
+        assert results == list(range(8))
+
+    def test_illegal_function_not_bisected(self, main_window):
+        """Test an unsupported function code fails the range in one request"""
+        client = make_client()
+        client.read_input_registers.side_effect = None
+        client.read_input_registers.return_value = Mock(
+            isError=Mock(return_value=True), exception_code=1
+        )
+        results = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "input", 0, 20, client=client
+        )
+
+        assert all(isinstance(r, dict) and "error" in r for r in results)
+        assert client.read_input_registers.call_count == 1
+
+    def test_progress_reported_per_request(self, main_window):
+        """Test on_progress reports the resolved fraction before each request"""
+        client = make_client(bad_addresses={5})
+        fractions = []
+        main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 20,
+            client=client, on_progress=fractions.append,
+        )
+
+        assert len(fractions) == client.read_holding_registers.call_count
+        assert fractions == sorted(fractions)
+        assert fractions[0] == 0 and fractions[-1] < 1
+
+    def test_nagle_disabled_after_connect(self, main_window):
+        """Test TCP_NODELAY is set on the connected socket"""
+        import socket
+
+        client = make_client()
+        main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 4, client=client
+        )
+
+        client.socket.setsockopt.assert_any_call(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+
+    def test_coils_trimmed_to_count(self, main_window):
+        """Test bit reads return exactly the requested number of values"""
+        client = make_client()
+        results = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "coils", 0, 10, client=client
+        )
+
+        assert results == [bool(a % 2) for a in range(10)]
+
+    def test_stale_connection_reconnects_once(self, main_window):
+        """Test a dropped kept-open connection is reopened and the read retried"""
+        client = make_client()
+        read = client.read_holding_registers.side_effect
+        client.read_holding_registers.side_effect = [
+            ConnectionResetError("Connection reset by peer"),
+            read(0, count=20),
+        ]
+        results = main_window.read_registers_individually(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 20, client=client
+        )
+
+        assert results == list(range(20))
+        client.close.assert_called_once()
+        assert client.connect.call_count == 2
+
+    def test_stale_connection_reconnects_block_read(self, main_window):
+        """Test a block read on a dropped connection succeeds after reconnecting"""
+        client = make_client()
+        read = client.read_holding_registers.side_effect
+        client.read_holding_registers.side_effect = [
+            ConnectionResetError("Connection reset by peer"),
+            read(0, count=4),
+        ]
+        result = main_window.read_registers(
+            "127.0.0.1", 502, 1, 1, "holding", 0, 4, client=client
+        )
+
+        assert result["success"]
+        assert result["registers"] == [0, 1, 2, 3]
+        assert client.connect.call_count == 2
+
+    def test_unit_id_uses_probed_keyword(self, main_window):
+        """Test the unit ID is passed with the keyword detected at import"""
+        from modscan_tool import UNIT_ID_KEYWORD
+
+        client = make_client()
+        result = main_window.read_registers(
+            "127.0.0.1", 502, 7, 1, "holding", 0, 4, client=client
+        )
+
+        assert result["success"]
+        client.read_holding_registers.assert_called_once_with(
+            0, count=4, **{UNIT_ID_KEYWORD: 7}
+        )
+
+
+@pytest.mark.integration
+class TestClientReuse:
+    """Test device connections are kept open between scans"""
+
+    @pytest.fixture
+    def main_window(self, qapp):
+        """Create main window whose clients are distinct mocks"""
+        with patch('modscan_tool.ModbusTcpClient', side_effect=lambda *a, **k: MagicMock()):
+            from modscan_tool import ModbusScannerGUI
+            window = ModbusScannerGUI(version="1.4.0")
+            yield window
+            window.close()
+
+    def test_same_device_reuses_client(self, main_window):
+        """Test repeat scans of a device share one connection"""
+        first = main_window._get_client("127.0.0.1", 502, 1.0)
+
+        assert main_window._get_client("127.0.0.1", 502, 1.0) is first
+        first.close.assert_not_called()
+
+    def test_switching_device_closes_old_client(self, main_window):
+        """Test only the most recent device keeps its connection open"""
+        first = main_window._get_client("127.0.0.1", 502, 1.0)
+        second = main_window._get_client("127.0.0.2", 502, 1.0)
+
+        assert second is not first
+        first.close.assert_called_once()
+
+    def test_close_event_closes_clients(self, main_window):
+        """Test closing the window closes kept-open connections"""
+        client = main_window._get_client("127.0.0.1", 502, 1.0)
+        main_window.close()
+
+        client.close.assert_called()
+
+    def test_single_scan_releases_client(self, main_window):
+        """Test a non-continuous scan closes its connection when it finishes"""
+        from modscan_tool import ScanConfig
+
+        client = main_window._get_client("127.0.0.1", 502, 1.0)
+        config = ScanConfig(
+            ip="127.0.0.1", port=502, timeout=1.0, unit_id=1, start_reg=0,
+            reg_count=4, register_type="holding", zero_based=True,
+            continuous=False, read_individually=False, interval=1.0,
+        )
+        main_window.scanning = True
+        main_window.scan_worker(config)
+
+        client.close.assert_called()
+        assert main_window._clients == {}
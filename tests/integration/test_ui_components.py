@@ -102,6 +102,29 @@ class TestScanControls:
             # Should have options for different register types
             assert main_window.register_type_combo.count() > 0
 
+    def test_scan_config_snapshot(self, main_window):
+        """Test the scan settings are copied from the form into a ScanConfig"""
+        main_window.start_register_entry.setText("40")
+        main_window.register_count_entry.setText("10")
+        main_window.polling_interval_entry.setText("0.01")
+        main_window.set_register_type("coils")
+
+        config = main_window._read_scan_config()
+
+        assert config.start_reg == 40
+        assert config.reg_count == 10
+        assert config.register_type == "coils"
+        assert config.interval == 0.1  # Clamped to the minimum
+
+    def test_log_message_colours(self, main_window):
+        """Test log tags map to the info label colour"""
+        main_window.log_message("Read failed", "error")
+        assert "color: red" in main_window.info_label.styleSheet()
+        assert main_window.info_label.text() == "Read failed"
+
+        main_window.log_message("Note", "other")
+        assert "color: black" in main_window.info_label.styleSheet()
+
 
 @pytest.mark.ui
 class TestResultsTable:
@@ -128,6 +151,56 @@ class TestResultsTable:
         # Table is a QTreeWidget - check top level items
         assert table.topLevelItemCount() >= 0
 
+    def test_unchanged_snapshot_skips_refresh(self, main_window):
+        """Test identical poll results don't rewrite the table"""
+        main_window.populate_table([1, 2, 3], 0)
+        assert main_window.results_table.topLevelItem(0).text(4) == "1"
+
+        with patch.object(main_window, '_update_table_values') as update:
+            main_window.populate_table([1, 2, 3], 0)
+            update.assert_not_called()
+
+            main_window.populate_table([1, 2, 4], 0)
+            update.assert_called_once()
+
+    def test_only_changed_rows_rewritten(self, main_window):
+        """Test a poll only rewrites changed registers and their 32-bit neighbours"""
+        main_window.populate_table([1, 2, 3, 4], 0)
+        table = main_window.results_table
+        table.topLevelItem(0).setText(4, "stale")
+
+        main_window.populate_table([1, 2, 9, 4], 0)
+
+        assert table.topLevelItem(0).text(4) == "stale"
+        assert table.topLevelItem(1).text(6) == str((2 << 16) | 9)
+        assert table.topLevelItem(2).text(4) == "9"
+
+    def test_imported_tags_shown_on_rebuild(self, main_window):
+        """Test register and bit tags appear in the Tag Name column"""
+        main_window.tag_mappings = {(2, None): "Pump", (2, 3): "Running"}
+        main_window._index_tag_mappings()
+        main_window.zero_based_check.setChecked(False)
+        main_window.populate_table([0, 8], 0)  # 1-based: addresses 1 and 2
+
+        pump = main_window.results_table.topLevelItem(1)
+        assert pump.text(1) == "Pump"
+        assert pump.child(3).text(1) == "Running"
+        assert pump.child(3).text(2) == "1"
+        assert main_window.results_table.topLevelItem(0).text(1) == ""
+
+    def test_filter_hides_non_matching_rows(self, main_window):
+        """Test filtering a column hides rows that don't match"""
+        main_window.populate_table([1, 2, 3], 0)
+        main_window.filter_column_combo.setCurrentIndex(5)  # Uint16
+        main_window.filter_entry.setText("2")
+        main_window.filter_table()
+
+        table = main_window.results_table
+        assert [table.topLevelItem(i).isHidden() for i in range(3)] == [True, False, True]
+
+        main_window.clear_filter()
+        assert not any(table.topLevelItem(i).isHidden() for i in range(3))
+
 
 @pytest.mark.ui
 class TestMenus:
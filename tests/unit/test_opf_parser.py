@@ -0,0 +1,83 @@
+"""
+Unit tests for the KEPServerEX .opf parser
+"""
+import pytest
+
+from opf_parser import OPFParser
+
+
+# Printable strings separated by binary noise, laid out like a KEPServerEX project
+SAMPLE_OPF = (
+    b"\x01\x02Channel1\x00\x00<192.168.1.10>.5\xff\xfe"
+    b"Pump_Run\x00Main pump (P1)\x0340012.3\x00"
+    b"\x10ab\x11Motor Speed\x0040020\x00"
+)
+
+
+@pytest.fixture
+def parser(tmp_path):
+    """Parser over a small binary .opf file"""
+    opf_file = tmp_path / "sample.opf"
+    opf_file.write_bytes(SAMPLE_OPF)
+    return OPFParser(str(opf_file))
+
+
+class TestExtractStrings:
+    """Test printable string extraction from binary data"""
+
+    def test_strings_split_on_binary(self, parser):
+        """Test printable runs are split on non-printable bytes"""
+        assert parser.extract_strings() == [
+            "Channel1",
+            "<192.168.1.10>.5",
+            "Pump_Run",
+            "Main pump (P1)",
+            "40012.3",
+            "Motor Speed",
+            "40020",
+        ]
+
+    def test_short_runs_dropped(self, parser):
+        """Test runs shorter than min_length are ignored"""
+        assert "ab" not in parser.extract_strings()
+        assert "ab" in parser.extract_strings(min_length=2)
+
+
+class TestParse:
+    """Test connection info and tag extraction"""
+
+    def test_connection_info(self, parser):
+        """Test the device IP and unit ID come from the <IP>.unitID string"""
+        result = parser.parse()
+
+        assert result["ip"] == "192.168.1.10"
+        assert result["unit_id"] == 5
+
+    def test_out_of_range_ip_ignored(self, tmp_path):
+        """Test strings with an octet above 255 aren't taken as IP addresses"""
+        opf_file = tmp_path / "bad_ip.opf"
+        opf_file.write_bytes(b"<300.1.1.1>.7\x00<10.0.0.255>\x00")
+
+        result = OPFParser(str(opf_file)).parse()
+
+        assert result["ip_addresses"] == ["10.0.0.255"]
+
+    def test_unit_id_after_invalid_ip_ignored(self, tmp_path):
+        """Test a unit ID is only taken from a <IP>.unitID string with a valid IP"""
+        opf_file = tmp_path / "bad_ip_unit.opf"
+        opf_file.write_bytes(b"<300.1.1.1>.7\x00<10.0.0.1>.3\x00")
+
+        result = OPFParser(str(opf_file)).parse()
+
+        assert result["unit_ids"] == [3]
+        assert result["unit_id"] == 3
+
+    def test_tag_mappings(self, parser):
+        """Test tag names are paired with the register address that follows"""
+        tags = parser.parse()["tags"]
+
+        assert [(t["tag_name"], t["address"], t["bit"]) for t in tags] == [
+            ("Pump_Run", 12, 3),
+            ("Motor Speed", 20, None),
+        ]
+        assert tags[0]["description"] == "Main pump (P1)"
@@ -0,0 +1,20 @@
+"""
+Unit tests for grouping register addresses into block reads
+"""
+from modscan_tool import _plan_reads
+
+
+class TestPlanReads:
+    """Test grouping of addresses into block reads"""
+
+    def test_contiguous_range_split_at_limit(self):
+        """Test a long range is split at the per-request limit"""
+        assert _plan_reads(range(300)) == [(0, 125), (125, 125), (250, 50)]
+
+    def test_gaps_split_blocks(self):
+        """Test a missing address ends a block"""
+        assert _plan_reads([1, 2, 4, 5]) == [(1, 2), (4, 2)]
+
+    def test_max_span(self):
+        """Test blocks are capped at max_span addresses"""
+        assert _plan_reads(range(5), max_span=2) == [(0, 2), (2, 2), (4, 1)]
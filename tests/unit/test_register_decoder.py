@@ -0,0 +1,92 @@
+"""
+Unit tests for block register decoding
+"""
+import pytest
+import struct
+
+from register_decoder import decode_registers
+
+
+class TestDecodeRegisters:
+    """Test decoding of register blocks into table columns"""
+
+    def test_single_register_columns(self):
+        """Test the 16-bit columns of a lone register"""
+        value, cells = decode_registers([0x4142])[0]
+
+        assert value == 0x4142
+        assert cells == [
+            "0x4142",
+            "0100000101000010",
+            "16706",
+            "16706",
+            "-",
+            "-",
+            "-",
+            "AB",
+        ]
+
+    def test_negative_int16(self):
+        """Test Int16 column uses two's complement"""
+        _, cells = decode_registers([0xFFFF])[0]
+        assert cells[3] == "-1"
+
+    @pytest.mark.parametrize("high,low,int16,int32", [
+        (0x7FFF, 0xFFFF, "32767", "2147483647"),
+        (0x8000, 0x0000, "-32768", "-2147483648"),
+        (0xFFFF, 0xFFFF, "-1", "-1"),
+    ])
+    def test_signed_boundaries(self, high, low, int16, int32):
+        """Test Int16/Int32 sign extension at the two's complement boundaries"""
+        _, cells = decode_registers([high, low])[0]
+
+        assert cells[3] == int16
+        assert cells[5] == int32
+
+    def test_float32_from_pair(self):
+        """Test 32-bit columns combine a register with the next one"""
+        high, low = struct.unpack(">HH", struct.pack(">f", 3.14))
+        rows = decode_registers([high, low])
+
+        _, cells = rows[0]
+        assert cells[4] == str((high << 16) | low)
+        assert cells[6] == "3.140000"
+
+        # Last register has no pair
+        assert rows[1][1][4:7] == ["-", "-", "-"]
+
+    def test_reverse_word_order(self):
+        """Test word order reversal uses the next register as the high word"""
+        high, low = struct.unpack(">HH", struct.pack(">f", -2.5))
+        _, cells = decode_registers([low, high], reverse_word=True)[0]
+
+        assert cells[6] == "-2.500000"
+        assert int(cells[5]) < 0
+
+    def test_reverse_byte_order(self):
+        """Test byte order reversal swaps bytes before decoding"""
+        value, cells = decode_registers([0x3412], reverse_byte=True)[0]
+
+        assert value == 0x1234
+        assert cells[0] == "0x1234"
+
+    def test_error_entries(self):
+        """Test failed registers decode to None and break 32-bit pairs"""
+        rows = decode_registers([1, None, 2])
+
+        assert rows[1] is None
+        assert rows[0][1][4] == "-"
+        assert rows[2][1][2] == "2"
+
+    @pytest.mark.parametrize("value,expected", [
+        (0x4100, "A"),
+        (0x0041, "A"),
+        (0x0000, "."),
+    ])
+    def test_string_column(self, value, expected):
+        """Test only printable ASCII bytes appear in the String column"""
+        assert decode_registers([value])[0][1][7] == expected
+
+    def test_empty_block(self):
+        """Test decoding an empty block"""
+        assert decode_registers([]) == []